@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from importlib import metadata
 
 
+@lru_cache(maxsize=1)
 def get_version() -> str:
     """Return the installed package version.
 
     When running from a checkout (e.g. via ``uv run``) the metadata lookup
     falls back to the default development version if the distribution is not
-    yet installed.
+    yet installed. The result is cached since it cannot change at runtime.
     """
 
     try:
@@ -6,6 +6,7 @@ import ctypes
 import os
 import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Iterable, Sequence
 
 
@@ -21,8 +22,9 @@ def is_user_admin() -> bool:
         return False
 
 
+@lru_cache(maxsize=1)
 def get_appdata_dir() -> str:
-    """Resolve the application data path for the current user."""
+    """Resolve the application data path for the current user (cached)."""
 
     # Prefer %APPDATA% if available, fallback to shell API.
     appdata = os.getenv("APPDATA")
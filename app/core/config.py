@@ -2,37 +2,65 @@
 
 from __future__ import annotations
 
+import copy
 import json
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
 import tomllib
 import tomli_w
 
 from .admin import get_appdata_dir
 
+try:  # Optional speedup, installed via the ``fast`` extra.
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - depends on installed extras
+    _json_loads = json.loads
+
 
 APP_DIR_NAME = "SanitySuite"
 CONFIG_FILE_NAME = "config.toml"
 WORKFLOWS_DIR_NAME = "workflows"
 
+_DIRS_READY = False
+
+# (path, st_mtime_ns, parsed data) for the last config file read from disk.
+_CONFIG_CACHE: Tuple[Path, int, Dict[str, Any]] | None = None
+
 
+@lru_cache(maxsize=1)
 def get_app_root() -> Path:
-    """Return the root application data directory."""
+    """Return the root application data directory (cached)."""
 
     return Path(get_appdata_dir()) / APP_DIR_NAME
 
 
 def ensure_app_dirs() -> None:
-    """Ensure the application data directory structure exists."""
+    """Ensure the application data directory structure exists.
+
+    The directories are only created on the first successful call.
+    """
+
+    global _DIRS_READY
+
+    if _DIRS_READY:
+        return
 
     root = get_app_root()
     (root / "logs").mkdir(parents=True, exist_ok=True)
     (root / WORKFLOWS_DIR_NAME).mkdir(parents=True, exist_ok=True)
+    _DIRS_READY = True
 
 
 def load_config() -> Dict[str, Any]:
-    """Load configuration from the TOML file, returning defaults if missing."""
+    """Load configuration from the TOML file, returning defaults if missing.
+
+    The parsed file is cached until its modification time changes; callers
+    receive their own copy so edits never leak into the cache.
+    """
+
+    global _CONFIG_CACHE
 
     ensure_app_dirs()
     config_path = get_app_root() / CONFIG_FILE_NAME
@@ -49,19 +77,28 @@ def load_config() -> Dict[str, Any]:
             },
         }
 
+    mtime_ns = config_path.stat().st_mtime_ns
+    cached = _CONFIG_CACHE
+    if cached is not None and cached[0] == config_path and cached[1] == mtime_ns:
+        return copy.deepcopy(cached[2])
+
     with config_path.open("rb") as fh:
         data = tomllib.load(fh)
 
-    return data
+    _CONFIG_CACHE = (config_path, mtime_ns, data)
+    return copy.deepcopy(data)
 
 
 def save_config(config: Dict[str, Any]) -> None:
     """Persist configuration to disk."""
 
+    global _CONFIG_CACHE
+
     ensure_app_dirs()
     config_path = get_app_root() / CONFIG_FILE_NAME
     with config_path.open("wb") as fh:
         tomli_w.dump(config, fh)
+    _CONFIG_CACHE = None
 
 
 def load_workflow(path: Path) -> Dict[str, Any]:
@@ -72,8 +109,7 @@ def load_workflow(path: Path) -> Dict[str, Any]:
             return tomllib.load(fh)
 
     if path.suffix.lower() == ".json":
-        with path.open("r", encoding="utf-8") as fh:
-            return json.load(fh)
+        return _json_loads(path.read_bytes())
 
     raise ValueError(f"Unsupported workflow format: {path.suffix}")
 
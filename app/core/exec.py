@@ -3,26 +3,71 @@
 from __future__ import annotations
 
 import asyncio
+import base64
+import codecs
 import logging
 import os
+import re
 import shlex
 import shutil
 import sys
+import threading
 import time
+import uuid
 from concurrent.futures import Future, ThreadPoolExecutor
-from typing import Dict, List, Literal, Sequence
-
-from pydantic import BaseModel, Field
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Dict, List, Literal, Mapping, Sequence, Tuple
 
 
 LOG = logging.getLogger(__name__)
 
 ExecutorType = Literal["process", "powershell", "cmd", "python"]
 DEFAULT_TIMEOUT_SECONDS = 45.0
-
-
+STREAM_CHUNK_SIZE = 64 * 1024
+
+SESSION_LINE_LIMIT = 1024 * 1024
+SESSION_CONNECT_TIMEOUT_SECONDS = 15.0
+
+# Runs inside the session interpreter. Commands arrive over a loopback socket
+# as "<token> <base64 UTF-8 script>" lines rather than on stdin, so native
+# programs that read stdin see an empty input instead of the protocol.
+_SESSION_BOOTSTRAP = """\
+$__sanity_client = [Net.Sockets.TcpClient]::new('127.0.0.1', {port})
+$__sanity_stream = $__sanity_client.GetStream()
+$__sanity_hello = [Text.Encoding]::ASCII.GetBytes("{hello}`n")
+$__sanity_stream.Write($__sanity_hello, 0, $__sanity_hello.Length)
+$__sanity_reader = [IO.StreamReader]::new($__sanity_stream, [Text.Encoding]::ASCII)
+while ($null -ne ($__sanity_line = $__sanity_reader.ReadLine())) {{
+    $__sanity_token, $__sanity_script = $__sanity_line -split ' ', 2
+    $global:LASTEXITCODE = 0
+    try {{
+        . ([scriptblock]::Create([Text.Encoding]::UTF8.GetString([Convert]::FromBase64String($__sanity_script)))) | Out-Default
+        $__sanity_ok = $?
+    }} catch {{
+        [Console]::Error.WriteLine($_)
+        $__sanity_ok = $false
+    }}
+    $__sanity_code = if ($LASTEXITCODE) {{ $LASTEXITCODE }} elseif ($__sanity_ok) {{ 0 }} else {{ 1 }}
+    [Console]::Out.WriteLine(('<<END:{{0}}:{{1}}>>' -f $__sanity_token, $__sanity_code))
+    [Console]::Error.WriteLine(('<<END:{{0}}>>' -f $__sanity_token))
+}}
+"""
+
+OutputCallback = Callable[[str], None]
+
+_THREAD_LOOPS = threading.local()
+
+_ENV_REFERENCE = re.compile(r"\$env:([A-Za-z_]\w*)")
+
+
+@lru_cache(maxsize=1)
 def _pwsh_executable() -> str:
-    """Return the preferred PowerShell executable for the host system."""
+    """Return the preferred PowerShell executable for the host system.
+
+    The ``PATH`` lookup is cached for the lifetime of the process; call
+    ``_pwsh_executable.cache_clear()`` if PowerShell is installed mid-session.
+    """
 
     return shutil.which("pwsh") or shutil.which("powershell") or "powershell"
 
@@ -38,38 +83,49 @@ class CommandTimedOut(RuntimeError):
         self.timeout = timeout
 
 
-class CommandSpec(BaseModel):
-    """Specification for running a single command step."""
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CommandSpec:
+    """Specification for running a single command step.
+
+    Specs are built by trusted tool code, so this is a plain frozen dataclass
+    rather than a validated model.
+    """
 
     executor: ExecutorType = "process"
     command: Sequence[str] | str
-    timeout: float | None = Field(default=DEFAULT_TIMEOUT_SECONDS)
+    timeout: float | None = DEFAULT_TIMEOUT_SECONDS
     elevate: bool = False
     env: Dict[str, str] | None = None
     cwd: str | None = None
 
-    model_config = {
-        "arbitrary_types_allowed": True,
-        "frozen": True,
-    }
-
     def format_for_logging(self) -> str:
         """Return a human-readable representation of the command."""
 
-        if isinstance(self.command, str):
-            return self.command
-        return " ".join(shlex.quote(part) for part in self.command)
+        return _format_command(_command_key(self.command))
+
 
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CommandResult:
+    """Outcome for a completed command step.
 
-class CommandResult(BaseModel):
-    """Outcome for a completed command step."""
+    Output is kept as raw bytes and only decoded when ``stdout``/``stderr``
+    are read, so callers that only check the exit code skip decoding.
+    """
 
     spec: CommandSpec
-    stdout: str
-    stderr: str
+    stdout_bytes: bytes
+    stderr_bytes: bytes
     exit_code: int
     duration_seconds: float
 
+    @property
+    def stdout(self) -> str:
+        return self.stdout_bytes.decode("utf-8", errors="replace")
+
+    @property
+    def stderr(self) -> str:
+        return self.stderr_bytes.decode("utf-8", errors="replace")
+
     @property
     def succeeded(self) -> bool:
         return self.exit_code == 0
@@ -80,8 +136,13 @@ async def run_command(
     *,
     is_admin: bool,
     logger: logging.Logger | None = None,
+    on_output: OutputCallback | None = None,
 ) -> CommandResult:
-    """Run a command asynchronously and capture the result."""
+    """Run a command asynchronously and capture the result.
+
+    Output is read incrementally while the process runs. When ``on_output``
+    is provided it receives decoded stdout/stderr text as it arrives.
+    """
 
     if spec.elevate and not is_admin:
         raise PermissionError(
@@ -90,9 +151,8 @@ async def run_command(
         )
 
     cmd = _build_command(spec)
-    env = os.environ.copy()
-    if spec.env:
-        env.update(spec.env)
+    # Let the child inherit our environment unless the spec overrides it.
+    env = {**os.environ, **spec.env} if spec.env else None
 
     start = time.perf_counter()
     process = await asyncio.create_subprocess_exec(
@@ -103,22 +163,24 @@ async def run_command(
         env=env,
     )
 
+    stdout_chunks: List[bytes] = []
+    stderr_chunks: List[bytes] = []
     timeout = spec.timeout
     try:
-        if timeout is None:
-            stdout_bytes, stderr_bytes = await process.communicate()
-        else:
-            stdout_bytes, stderr_bytes = await asyncio.wait_for(
-                process.communicate(), timeout=timeout
-            )
+        await asyncio.wait_for(
+            asyncio.gather(
+                _drain_stream(process.stdout, stdout_chunks, on_output),
+                _drain_stream(process.stderr, stderr_chunks, on_output),
+                process.wait(),
+            ),
+            timeout=timeout,
+        )
     except asyncio.TimeoutError as exc:
         process.kill()
-        await process.communicate()
+        await process.wait()
         raise CommandTimedOut(spec, timeout or 0.0) from exc
 
     duration = time.perf_counter() - start
-    stdout = stdout_bytes.decode("utf-8", errors="replace")
-    stderr = stderr_bytes.decode("utf-8", errors="replace")
 
     if logger:
         logger.debug(
@@ -127,65 +189,374 @@ async def run_command(
 
     return CommandResult(
         spec=spec,
-        stdout=stdout,
-        stderr=stderr,
+        stdout_bytes=b"".join(stdout_chunks),
+        stderr_bytes=b"".join(stderr_chunks),
         exit_code=process.returncode,
         duration_seconds=duration,
     )
 
 
+async def _drain_stream(
+    stream: asyncio.StreamReader,
+    chunks: List[bytes],
+    on_output: OutputCallback | None,
+) -> None:
+    """Collect a subprocess pipe until EOF, forwarding text as it arrives."""
+
+    decoder = (
+        codecs.getincrementaldecoder("utf-8")(errors="replace") if on_output else None
+    )
+    while True:
+        chunk = await stream.read(STREAM_CHUNK_SIZE)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        if decoder is not None:
+            text = decoder.decode(chunk)
+            if text:
+                on_output(text)
+
+    if decoder is not None:
+        tail = decoder.decode(b"", final=True)
+        if tail:
+            on_output(tail)
+
+
 def run_command_sync(
     spec: CommandSpec,
     *,
     is_admin: bool,
     logger: logging.Logger | None = None,
 ) -> CommandResult:
-    """Synchronously execute a command using an isolated asyncio loop."""
+    """Synchronously execute a command on the calling thread's event loop."""
+
+    return _thread_loop().run_until_complete(
+        run_command(spec, is_admin=is_admin, logger=logger)
+    )
+
+
+def _thread_loop() -> asyncio.AbstractEventLoop:
+    """Return a persistent event loop owned by the calling thread.
 
-    return asyncio.run(run_command(spec, is_admin=is_admin, logger=logger))
+    Reusing one loop per worker thread avoids building and tearing down a
+    loop (and its selector/proactor) for every command.
+    """
+
+    loop = getattr(_THREAD_LOOPS, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        _THREAD_LOOPS.loop = loop
+    return loop
 
 
 def _build_command(spec: CommandSpec) -> List[str]:
-    """Convert a command specification into an argv list."""
+    """Convert a command specification into an argv list.
+
+    PowerShell expands ``$env:NAME`` itself; for the other executors the
+    references are substituted here from ``spec.env`` over ``os.environ``.
+    """
+
+    command = spec.command
+    if spec.executor != "powershell":
+        if isinstance(command, str):
+            command = _expand_env_references(command, spec.env)
+        else:
+            command = [_expand_env_references(part, spec.env) for part in command]
+    return list(_build_argv(spec.executor, _command_key(command)))
+
+
+def _expand_env_references(command: str, env: Mapping[str, str] | None) -> str:
+    template, keys = _compile_env_template(command)
+    if not keys:
+        return command
+
+    # Names match case-insensitively, as in PowerShell and the Windows
+    # environment; unknown references are left as written.
+    overrides = {name.upper(): value for name, value in (env or {}).items()}
+    values: Dict[str, str] = {}
+    for key in keys:
+        value = overrides.get(key.upper())
+        if value is None:
+            value = os.environ.get(key)
+        values[key] = f"$env:{key}" if value is None else value
+    return template.format_map(values)
+
+
+@lru_cache(maxsize=256)
+def _compile_env_template(command: str) -> Tuple[str, Tuple[str, ...]]:
+    """Turn ``$env:NAME`` references into a ``str.format`` template, once per command.
+
+    Returns the template and the referenced names; the names are empty when
+    the command has nothing to substitute.
+    """
+
+    keys = tuple(dict.fromkeys(_ENV_REFERENCE.findall(command)))
+    if not keys:
+        return command, ()
+    escaped = command.replace("{", "{{").replace("}", "}}")
+    return _ENV_REFERENCE.sub(lambda match: "{" + match.group(1) + "}", escaped), keys
+
+
+def _command_key(command: Sequence[str] | str) -> str | Tuple[str, ...]:
+    """Return a hashable form of a spec's command for cache lookups."""
+
+    return command if isinstance(command, str) else tuple(command)
+
 
-    if spec.executor == "powershell":
-        command = spec.command
-        if isinstance(command, (list, tuple)):
+@lru_cache(maxsize=256)
+def _format_command(command: str | Tuple[str, ...]) -> str:
+    """Quote a command for display, memoized per distinct command."""
+
+    if isinstance(command, str):
+        return command
+    return " ".join(shlex.quote(part) for part in command)
+
+
+@lru_cache(maxsize=256)
+def _build_argv(executor: ExecutorType, command: str | Tuple[str, ...]) -> Tuple[str, ...]:
+    """Build the argv for a command, memoized so repeat runs skip the lexer."""
+
+    if executor == "powershell":
+        if isinstance(command, tuple):
             command = " ".join(command)
-        return [
+        return (
             _pwsh_executable(),
             "-NoLogo",
             "-NoProfile",
             "-NonInteractive",
             "-Command",
             command,
-        ]
+        )
 
-    if spec.executor == "cmd":
-        command = spec.command
-        if isinstance(command, (list, tuple)):
+    if executor == "cmd":
+        if isinstance(command, tuple):
             command = " ".join(command)
-        return ["cmd.exe", "/C", command]
+        return ("cmd.exe", "/C", command)
 
-    if spec.executor == "python":
-        command = spec.command
+    if executor == "python":
         if isinstance(command, str):
             argv = shlex.split(command, posix=False)
         else:
-            argv = list(command)
-        return [sys.executable, "-m", *argv]
+            argv = command
+        return (sys.executable, "-m", *argv)
 
     # Default: process execution
-    command = spec.command
     if isinstance(command, str):
-        return shlex.split(command, posix=False)
-    return list(command)
+        return tuple(shlex.split(command, posix=False))
+    return command
+
+
+class PowerShellSession:
+    """Long-lived PowerShell process that runs commands sent over a local socket.
+
+    A cold ``powershell.exe`` start costs hundreds of milliseconds, so chained
+    PowerShell steps share one interpreter. After each command the session
+    writes a sentinel to stdout (carrying the exit code) and to stderr, which
+    marks where its output ends. The interpreter's stdin is ``NUL``, so
+    commands that read input get EOF. Commands are serialized; the session is
+    bound to the event loop that first starts it.
+
+    The interpreter lives as long as the owning runner, so variables,
+    ``Set-Location`` and ``$env:`` changes made by one action carry over to
+    every later action that runs in the session.
+    """
+
+    def __init__(self) -> None:
+        self._process: asyncio.subprocess.Process | None = None
+        self._commands: asyncio.StreamWriter | None = None
+        self._lock = asyncio.Lock()
+
+    @staticmethod
+    def supports(spec: CommandSpec) -> bool:
+        """Return True if ``spec`` can run in a shared session.
+
+        Elevated steps and steps with their own environment or working
+        directory keep using a one-shot process.
+        """
+
+        return spec.executor == "powershell" and not (spec.elevate or spec.env or spec.cwd)
+
+    async def run(
+        self,
+        spec: CommandSpec,
+        *,
+        logger: logging.Logger | None = None,
+        on_output: OutputCallback | None = None,
+    ) -> CommandResult:
+        """Run ``spec`` in the session and capture its result."""
+
+        async with self._lock:
+            try:
+                process, commands = await self._ensure_started()
+            except (OSError, asyncio.TimeoutError) as exc:
+                LOG.warning("PowerShell session unavailable, running step standalone: %s", exc)
+                return await run_command(spec, is_admin=False, logger=logger, on_output=on_output)
+
+            token = uuid.uuid4().hex
+            stdout_marker = f"<<END:{token}:"
+            stderr_marker = f"<<END:{token}>>"
+            script = base64.b64encode(_powershell_text(spec.command).encode("utf-8"))
+
+            stdout_chunks: List[bytes] = []
+            stderr_chunks: List[bytes] = []
+            readers: asyncio.Future[List[str]] | None = None
+            start = time.perf_counter()
+            try:
+                commands.write(token.encode("ascii") + b" " + script + b"\n")
+                await commands.drain()
+                readers = asyncio.gather(
+                    _read_until_marker(process.stdout, stdout_marker, stdout_chunks, on_output),
+                    _read_until_marker(process.stderr, stderr_marker, stderr_chunks, on_output),
+                )
+                marker_lines = await asyncio.wait_for(readers, timeout=spec.timeout)
+            except asyncio.TimeoutError as exc:
+                # PowerShell cannot cancel a running command remotely.
+                self._abandon(readers)
+                raise CommandTimedOut(spec, spec.timeout or 0.0) from exc
+            except (EOFError, ConnectionError):
+                # The command ended the interpreter (e.g. ``exit 3``).
+                await process.wait()
+                exit_code = process.returncode
+                self.close()
+            except BaseException:
+                # Cancelled mid-command: the late output and sentinel must not
+                # be read as the next command's, so the interpreter goes too.
+                self._abandon(readers)
+                raise
+            else:
+                exit_code = int(marker_lines[0][len(stdout_marker):].rstrip()[:-2])
+
+        duration = time.perf_counter() - start
+        if logger:
+            logger.debug(
+                "Command finished",
+                extra={"command": spec.format_for_logging(), "exit_code": exit_code},
+            )
+
+        return CommandResult(
+            spec=spec,
+            stdout_bytes=b"".join(stdout_chunks),
+            stderr_bytes=b"".join(stderr_chunks),
+            exit_code=exit_code,
+            duration_seconds=duration,
+        )
+
+    async def _ensure_started(self) -> Tuple[asyncio.subprocess.Process, asyncio.StreamWriter]:
+        if self._process is not None and self._process.returncode is None and self._commands is not None:
+            return self._process, self._commands
+
+        self.close()
+        hello = uuid.uuid4().hex.encode("ascii")
+        connections: asyncio.Queue[Tuple[asyncio.StreamReader, asyncio.StreamWriter]] = asyncio.Queue()
+        server = await asyncio.start_server(
+            lambda reader, writer: connections.put_nowait((reader, writer)), "127.0.0.1", 0
+        )
+        try:
+            port = server.sockets[0].getsockname()[1]
+            bootstrap = _SESSION_BOOTSTRAP.format(port=port, hello=hello.decode("ascii"))
+            self._process = await asyncio.create_subprocess_exec(
+                _pwsh_executable(),
+                "-NoLogo",
+                "-NoProfile",
+                "-NonInteractive",
+                "-EncodedCommand",
+                base64.b64encode(bootstrap.encode("utf-16-le")).decode("ascii"),
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                limit=SESSION_LINE_LIMIT,
+            )
+            try:
+                self._commands = await asyncio.wait_for(
+                    _accept_session(connections, hello), SESSION_CONNECT_TIMEOUT_SECONDS
+                )
+            except asyncio.TimeoutError:
+                self.close()
+                raise
+        finally:
+            server.close()
+        return self._process, self._commands
+
+    def _abandon(self, readers: asyncio.Future[List[str]] | None) -> None:
+        """Close the session after a command ended without its sentinel."""
+
+        self.close()
+        if readers is not None:
+            readers.cancel()
+            # Retrieve whatever the readers end with so it is not reported as lost.
+            readers.add_done_callback(lambda future: future.cancelled() or future.exception())
+
+    def close(self) -> None:
+        """Terminate the interpreter; the next command starts a fresh one."""
+
+        commands, self._commands = self._commands, None
+        if commands is not None:
+            commands.close()
+        process, self._process = self._process, None
+        if process is not None and process.returncode is None:
+            try:
+                process.kill()
+            except ProcessLookupError:
+                pass
+
+
+def _powershell_text(command: Sequence[str] | str) -> str:
+    return command if isinstance(command, str) else " ".join(command)
+
+
+async def _accept_session(
+    connections: asyncio.Queue[Tuple[asyncio.StreamReader, asyncio.StreamWriter]],
+    hello: bytes,
+) -> asyncio.StreamWriter:
+    """Return the command stream of the first connection that presents ``hello``."""
+
+    while True:
+        reader, writer = await connections.get()
+        try:
+            greeting = await reader.readline()
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+            greeting = b""
+        if greeting.strip() == hello:
+            return writer
+        writer.close()
+
+
+async def _read_until_marker(
+    stream: asyncio.StreamReader,
+    marker: str,
+    chunks: List[bytes],
+    on_output: OutputCallback | None,
+) -> str:
+    """Collect output from a session pipe until ``marker``; return the marker line.
+
+    The marker may follow output that did not end with a newline, so it is
+    matched anywhere in the line and the text before it is kept as output.
+    """
+
+    marker_bytes = marker.encode("ascii")
+    while True:
+        line = await stream.readline()
+        if not line:
+            raise EOFError("PowerShell session exited")
+        index = line.find(marker_bytes)
+        if index >= 0:
+            output, line = line[:index], line[index:]
+        else:
+            output = line
+        if output:
+            chunks.append(output)
+            if on_output:
+                on_output(output.decode("utf-8", errors="replace"))
+        if index >= 0:
+            return line.decode("ascii", errors="replace")
 
 
 class AsyncCommandRunner:
-    """Thread-backed command runner to keep the UI responsive."""
+    """Command runner that keeps subprocess work off the UI's critical path."""
 
     def __init__(self, max_workers: int = 4) -> None:
+        self._max_workers = max_workers
+        self._pwsh_session = PowerShellSession()
         self._executor = ThreadPoolExecutor(
             max_workers=max_workers, thread_name_prefix="sanity-exec"
         )
@@ -196,12 +567,21 @@ class AsyncCommandRunner:
         *,
         is_admin: bool,
         logger: logging.Logger | None = None,
+        parallel: bool = False,
     ) -> Future[List[CommandResult]]:
-        """Run a sequence of commands in order on a worker thread."""
+        """Run a sequence of commands on a worker thread.
+
+        Steps run in order unless ``parallel`` is set, in which case they are
+        overlapped on the worker's event loop.
+        """
 
         specs = list(specs)
 
         def _runner() -> List[CommandResult]:
+            if parallel:
+                return _thread_loop().run_until_complete(
+                    self._gather_steps(specs, is_admin=is_admin, logger=logger)
+                )
             results: List[CommandResult] = []
             for step in specs:
                 LOG.debug("Executing step %s", step.format_for_logging())
@@ -217,13 +597,58 @@ class AsyncCommandRunner:
         *,
         is_admin: bool,
         logger: logging.Logger | None = None,
+        parallel: bool = False,
+        on_output: OutputCallback | None = None,
+    ) -> List[CommandResult]:
+        """Asynchronously execute a sequence of commands on the running loop.
+
+        Steps run in order by default, with eligible PowerShell steps sharing
+        the runner's :class:`PowerShellSession`. Pass ``parallel=True`` for
+        independent steps so their subprocesses overlap, bounded by
+        ``max_workers``. ``on_output`` receives live output from every step.
+        """
+
+        specs = list(specs)
+        if parallel:
+            return await self._gather_steps(
+                specs, is_admin=is_admin, logger=logger, on_output=on_output
+            )
+
+        results: List[CommandResult] = []
+        for step in specs:
+            LOG.debug("Executing step %s", step.format_for_logging())
+            if self._pwsh_session.supports(step):
+                result = await self._pwsh_session.run(
+                    step, logger=logger, on_output=on_output
+                )
+            else:
+                result = await run_command(
+                    step, is_admin=is_admin, logger=logger, on_output=on_output
+                )
+            results.append(result)
+        return results
+
+    async def _gather_steps(
+        self,
+        specs: Sequence[CommandSpec],
+        *,
+        is_admin: bool,
+        logger: logging.Logger | None,
+        on_output: OutputCallback | None = None,
     ) -> List[CommandResult]:
-        """Asynchronously execute a sequence of commands."""
+        semaphore = asyncio.Semaphore(self._max_workers)
+
+        async def _run_one(step: CommandSpec) -> CommandResult:
+            async with semaphore:
+                LOG.debug("Executing step %s", step.format_for_logging())
+                return await run_command(
+                    step, is_admin=is_admin, logger=logger, on_output=on_output
+                )
 
-        future = self.submit_sequence(specs, is_admin=is_admin, logger=logger)
-        return await asyncio.wrap_future(future)
+        return list(await asyncio.gather(*(_run_one(step) for step in specs)))
 
     def shutdown(self) -> None:
+        self._pwsh_session.close()
         self._executor.shutdown(wait=False, cancel_futures=True)
 
 
@@ -232,6 +657,8 @@ __all__ = [
     "CommandResult",
     "CommandSpec",
     "CommandTimedOut",
+    "OutputCallback",
+    "PowerShellSession",
     "run_command",
     "run_command_sync",
 ]
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import logging
-from logging.handlers import TimedRotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
 from pathlib import Path
 
 from .config import ensure_app_dirs, get_app_root
@@ -11,13 +12,22 @@ from .config import ensure_app_dirs, get_app_root
 
 LOG_FILE_BASENAME = "app.log"
 
+_LISTENER: QueueListener | None = None
+_QUEUE_HANDLER: QueueHandler | None = None
+
 
 def configure_logging(level: int = logging.INFO) -> None:
-    """Configure application-wide logging with rotation."""
+    """Configure application-wide logging with rotation.
+
+    Records are queued by the calling thread and written to disk by a
+    background listener, so logging never blocks on file I/O. Call
+    :func:`shutdown_logging` on exit to flush pending records.
+    """
+
+    global _LISTENER, _QUEUE_HANDLER
 
     ensure_app_dirs()
     logs_dir = get_app_root() / "logs"
-    logs_dir.mkdir(parents=True, exist_ok=True)
 
     handler = TimedRotatingFileHandler(
         logs_dir / LOG_FILE_BASENAME,
@@ -31,9 +41,31 @@ def configure_logging(level: int = logging.INFO) -> None:
     )
     handler.setFormatter(formatter)
 
+    shutdown_logging()
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _LISTENER = QueueListener(log_queue, handler, respect_handler_level=True)
+    _LISTENER.start()
+
     root_logger = logging.getLogger()
     root_logger.setLevel(level)
-    root_logger.addHandler(handler)
+    _QUEUE_HANDLER = QueueHandler(log_queue)
+    root_logger.addHandler(_QUEUE_HANDLER)
+
+
+def shutdown_logging() -> None:
+    """Stop the background log writer, flushing queued records to disk."""
+
+    global _LISTENER, _QUEUE_HANDLER
+
+    if _QUEUE_HANDLER is not None:
+        logging.getLogger().removeHandler(_QUEUE_HANDLER)
+        _QUEUE_HANDLER = None
+    if _LISTENER is None:
+        return
+    _LISTENER.stop()
+    for handler in _LISTENER.handlers:
+        handler.close()
+    _LISTENER = None
 
 
-__all__ = ["configure_logging"]
+__all__ = ["configure_logging", "shutdown_logging"]
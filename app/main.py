@@ -5,17 +5,19 @@ from __future__ import annotations
 import asyncio
 import getpass
 import logging
+import threading
+from typing import Callable
 
 from dearpygui import dearpygui as dpg
 
 from . import get_version
 from .core import admin as admin_core
-from .core.logging import configure_logging
+from .core.logging import configure_logging, shutdown_logging
 from .network import NetworkController
 from .ports import PortsController
 from .processes import ProcessesController
 from .ui.layout import LayoutHandles, WindowState, create_main_window, sync_layout_to_viewport
-from .ui.navigation import NavigationController, TabDefinition
+from .ui.navigation import NavigationController, TabBuilder, TabDefinition
 from .ui.tabs import (
     build_dashboard_tab,
     build_hosts_tab,
@@ -31,8 +33,23 @@ from .ui.tabs import (
 LOG = logging.getLogger(__name__)
 
 
-async def _async_main() -> None:
-    configure_logging()
+def _with_controller(builder: TabBuilder, attach: Callable[[], object]) -> TabBuilder:
+    """Wrap ``builder`` so the tab's controller is attached once its widgets exist."""
+
+    def _build(parent: str) -> None:
+        builder(parent)
+        attach()
+
+    return _build
+
+
+def _run_ui(loop: asyncio.AbstractEventLoop) -> None:
+    """Build the UI and block in Dear PyGui's native render loop.
+
+    Controllers schedule their async work onto ``loop``, which runs on a
+    background thread; the window stays on the main thread that created it.
+    The caller owns the Dear PyGui context.
+    """
 
     is_admin = admin_core.is_user_admin()
     state = WindowState(
@@ -40,7 +57,6 @@ async def _async_main() -> None:
         active_user=getpass.getuser(),
     )
 
-    dpg.create_context()
     dpg.create_viewport(
         title=f"Windows Sanity Suite {get_version()}",
         width=1100,
@@ -53,18 +69,19 @@ async def _async_main() -> None:
         handles,
         tabs=[
             TabDefinition("dashboard", "Dashboard", build_dashboard_tab),
-            TabDefinition("ports", "Ports", build_ports_tab),
-            TabDefinition("network", "Network", build_network_tab),
-            TabDefinition("processes", "Processes", build_processes_tab),
+            TabDefinition("ports", "Ports", _with_controller(build_ports_tab, lambda: PortsController(loop=loop))),
+            TabDefinition(
+                "network",
+                "Network",
+                _with_controller(build_network_tab, lambda: NetworkController(loop=loop, is_admin=is_admin)),
+            ),
+            TabDefinition("processes", "Processes", _with_controller(build_processes_tab, ProcessesController)),
             TabDefinition("services", "Services", build_services_tab),
             TabDefinition("hosts", "Hosts", build_hosts_tab),
             TabDefinition("workflows", "Workflows", build_workflows_tab),
             TabDefinition("settings", "Settings", build_settings_tab),
         ],
     )
-    PortsController()
-    NetworkController(is_admin=is_admin)
-    ProcessesController()
     dpg.setup_dearpygui()
     dpg.show_viewport()
     dpg.set_primary_window(handles.root_window, True)
@@ -72,15 +89,23 @@ async def _async_main() -> None:
     dpg.set_viewport_resize_callback(lambda sender, data: sync_layout_to_viewport(handles))
 
     LOG.info("Application started")
-    while dpg.is_dearpygui_running():
-        dpg.render_dearpygui_frame()
-        await asyncio.sleep(0)
-
-    dpg.destroy_context()
+    dpg.start_dearpygui()
 
 
 def main() -> None:
-    asyncio.run(_async_main())
+    configure_logging()
+    loop = asyncio.new_event_loop()
+    loop_thread = threading.Thread(target=loop.run_forever, name="sanity-async", daemon=True)
+    loop_thread.start()
+    dpg.create_context()
+    try:
+        _run_ui(loop)
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        loop_thread.join(timeout=5)
+        # Destroy widgets only once no coroutine can resume and touch them.
+        dpg.destroy_context()
+        shutdown_logging()
 
 
 if __name__ == "__main__":
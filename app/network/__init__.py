@@ -3,7 +3,12 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Iterable, Optional
+import logging
+import time
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Coroutine, Deque, Dict, Iterable, Optional, Tuple
 
 import psutil
 from dearpygui import dearpygui as dpg
@@ -12,11 +17,50 @@ from app.core.exec import AsyncCommandRunner, CommandResult
 from app.tools.network import NetworkTool
 
 
+LOG = logging.getLogger(__name__)
+
+ADAPTER_SNAPSHOT_TTL_SECONDS = 0.5
+# Live output shown while an action runs; older text scrolls out.
+OUTPUT_BUFFER_CHARS = 64 * 1024
+
+
+@dataclass(slots=True)
+class _AdapterCache:
+    timestamp: float = float("-inf")
+    addrs: Dict[str, Any] = field(default_factory=dict)
+    stats: Dict[str, Any] = field(default_factory=dict)
+
+
+_ADAPTER_CACHE = _AdapterCache()
+
+
+def _adapter_snapshot(ttl: float = ADAPTER_SNAPSHOT_TTL_SECONDS) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Return ``(net_if_addrs, net_if_stats)``, reusing a snapshot younger than ``ttl``."""
+
+    now = time.monotonic()
+    if now - _ADAPTER_CACHE.timestamp < ttl:
+        return _ADAPTER_CACHE.addrs, _ADAPTER_CACHE.stats
+
+    _ADAPTER_CACHE.addrs = psutil.net_if_addrs()
+    _ADAPTER_CACHE.stats = psutil.net_if_stats()
+    _ADAPTER_CACHE.timestamp = now
+    return _ADAPTER_CACHE.addrs, _ADAPTER_CACHE.stats
+
+
+@dataclass(slots=True)
+class _AdapterRow:
+    row_tag: int | str
+    ip_tag: int | str
+    state_tag: int | str
+    ip_addresses: str
+    state: str
+
+
 class NetworkController:
     """Handle interactions for the network quick-fix tab."""
 
-    def __init__(self, *, is_admin: bool) -> None:
-        self._loop = asyncio.get_running_loop()
+    def __init__(self, *, loop: asyncio.AbstractEventLoop, is_admin: bool) -> None:
+        self._loop = loop
         self._runner = AsyncCommandRunner(max_workers=2)
         self._is_admin = is_admin
         self._tool = NetworkTool()
@@ -25,6 +69,9 @@ class NetworkController:
         self._output_tag = "network_output"
         self._status_tag = "network_status_text"
         self._adapters_table_tag = "network_adapters_table"
+        self._adapter_rows: Dict[str, _AdapterRow] = {}
+        self._output_chunks: Deque[str] = deque()
+        self._output_size = 0
 
         dpg.set_item_callback("network_flush_button", self._make_action_callback("flush_dns"))
         dpg.set_item_callback("network_renew_button", self._make_action_callback("renew_ip"))
@@ -36,11 +83,24 @@ class NetworkController:
         if not is_admin:
             dpg.configure_item("network_winsock_button", enabled=False)
 
-        self.refresh_adapters()
+        self._schedule(self.refresh_adapters())
+
+    def _schedule(self, coro: Coroutine[Any, Any, None]) -> None:
+        """Run ``coro`` on the controller's loop; safe from DPG callback threads."""
+
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        future.add_done_callback(self._report_failure)
+
+    def _report_failure(self, future: Future[None]) -> None:
+        if future.cancelled() or future.exception() is None:
+            return
+        exc = future.exception()
+        LOG.error("Network task failed", exc_info=exc)
+        self._set_status(f"Error: {exc}")
 
     def _make_action_callback(self, action_id: str):
         def _callback(sender: int | str, app_data: None, user_data: None) -> None:
-            self._loop.create_task(self._run_action(action_id))
+            self._schedule(self._run_action(action_id))
 
         return _callback
 
@@ -52,6 +112,7 @@ class NetworkController:
             results = await self._runner.run_sequence_async(
                 action.exec_steps,
                 is_admin=self._is_admin,
+                on_output=self._append_output,
             )
         except Exception as exc:  # noqa: BLE001 - surface to UI
             self._set_status(f"Action failed: {exc}")
@@ -63,36 +124,52 @@ class NetworkController:
         else:
             failed = [str(result.exit_code) for result in results if not result.succeeded]
             self._set_status(f"{action.label} completed with errors (exit codes: {', '.join(failed)})")
-        self.refresh_adapters()
+        await self.refresh_adapters()
 
     def _render_results(self, results: Iterable[CommandResult]) -> str:
-        lines: list[str] = []
+        parts: list[str] = []
         for result in results:
-            lines.append(f"$ {result.spec.format_for_logging()} (exit {result.exit_code})")
-            if result.stdout:
-                lines.append(result.stdout.strip())
-            if result.stderr:
-                lines.append(result.stderr.strip())
-            lines.append("")
-        return "\n".join(line for line in lines if line)
+            parts.append(f"$ {result.spec.format_for_logging()} (exit {result.exit_code})")
+            stdout = result.stdout.strip() if result.stdout_bytes else ""
+            if stdout:
+                parts.append(stdout)
+            stderr = result.stderr.strip() if result.stderr_bytes else ""
+            if stderr:
+                parts.append(stderr)
+        return "\n".join(parts)
 
     def _set_output(self, text: str) -> None:
+        self._output_chunks.clear()
+        self._output_size = 0
         dpg.set_value(self._output_tag, text)
 
+    def _append_output(self, text: str) -> None:
+        """Add streamed text, keeping only the last ``OUTPUT_BUFFER_CHARS``."""
+
+        self._output_chunks.append(text)
+        self._output_size += len(text)
+        while self._output_size - len(self._output_chunks[0]) >= OUTPUT_BUFFER_CHARS:
+            self._output_size -= len(self._output_chunks.popleft())
+        dpg.set_value(self._output_tag, "".join(self._output_chunks)[-OUTPUT_BUFFER_CHARS:])
+
     def _set_status(self, text: str) -> None:
         dpg.set_value(self._status_tag, text)
 
     def _on_refresh_clicked(self, sender: int | str, app_data: None, user_data: None) -> None:
-        self.refresh_adapters()
+        self._schedule(self._refresh_and_report())
+
+    async def _refresh_and_report(self) -> None:
+        await self.refresh_adapters()
         self._set_status("Adapter list refreshed")
 
-    def refresh_adapters(self) -> None:
-        children = dpg.get_item_children(self._adapters_table_tag, 1) or []
-        for child in children:
-            dpg.delete_item(child)
+    async def refresh_adapters(self) -> None:
+        """Sync the adapter table, touching only rows whose data changed.
+
+        Enumeration runs in a worker thread; widgets are updated back on the
+        event loop.
+        """
 
-        addrs = psutil.net_if_addrs()
-        stats = psutil.net_if_stats()
+        addrs, stats = await asyncio.to_thread(_adapter_snapshot)
         for name, entries in addrs.items():
             ip_addresses = ", ".join(
                 addr.address
@@ -101,10 +178,25 @@ class NetworkController:
             ) or "—"
 
             state = "Up" if stats.get(name, None) and stats[name].isup else "Down"
-            with dpg.table_row(parent=self._adapters_table_tag):
-                dpg.add_text(name)
-                dpg.add_text(ip_addresses)
-                dpg.add_text(state)
+            row = self._adapter_rows.get(name)
+            if row is None:
+                # Explicit parents: the container stack is shared with UI-thread builders.
+                row_tag = dpg.add_table_row(parent=self._adapters_table_tag)
+                dpg.add_text(name, parent=row_tag)
+                ip_tag = dpg.add_text(ip_addresses, parent=row_tag)
+                state_tag = dpg.add_text(state, parent=row_tag)
+                self._adapter_rows[name] = _AdapterRow(row_tag, ip_tag, state_tag, ip_addresses, state)
+                continue
+
+            if row.ip_addresses != ip_addresses:
+                dpg.set_value(row.ip_tag, ip_addresses)
+                row.ip_addresses = ip_addresses
+            if row.state != state:
+                dpg.set_value(row.state_tag, state)
+                row.state = state
+
+        for name in self._adapter_rows.keys() - addrs.keys():
+            dpg.delete_item(self._adapter_rows.pop(name).row_tag)
 
 
 __all__ = ["NetworkController"]
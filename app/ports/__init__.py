@@ -2,14 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
+from concurrent.futures import Future
 from dataclasses import dataclass
-from typing import Iterable, List
+from typing import Any, Coroutine, Iterable, List, Sequence, Tuple
 
 import psutil
 
 from dearpygui import dearpygui as dpg
 
-from app.tools import PortBinding, list_bindings
+from app.tools import PortBinding, clear_connections_cache, list_bindings, process_snapshot, used_ports
+from app.ui.tabs import PORTS_ROW_POOL_SIZE, PortsRowTags, add_ports_row, ports_row_tags
+
+
+LOG = logging.getLogger(__name__)
 
 
 @dataclass(slots=True)
@@ -20,7 +27,8 @@ class PortScanResult:
 class PortsController:
     """Handle interactions for the ports inspector tab."""
 
-    def __init__(self) -> None:
+    def __init__(self, *, loop: asyncio.AbstractEventLoop) -> None:
+        self._loop = loop
         self._table_tag = "ports_table"
         self._port_input_tag = "ports_input_port"
         self._status_tag = "ports_status_text"
@@ -34,10 +42,31 @@ class PortsController:
         dpg.set_item_callback(self._copy_button_tag, self._on_copy_clicked)
         dpg.set_item_callback(self._suggest_button_tag, self._on_suggest_clicked)
         self._bindings_cache: list[PortBinding] = []
+        self._conflict_theme_id: int | None = None
+
+        self._rows: List[PortsRowTags] = [ports_row_tags(index) for index in range(PORTS_ROW_POOL_SIZE)]
+        for row in self._rows:
+            dpg.set_item_callback(row.kill, self._on_kill_clicked)
+        # Last (binding, conflict) rendered into each pooled row.
+        self._rendered: List[Tuple[PortBinding, bool] | None] = [None] * len(self._rows)
+        self._visible_rows = 0
+
+    def _schedule(self, coro: Coroutine[Any, Any, None]) -> None:
+        """Run ``coro`` on the controller's loop; safe from DPG callback threads."""
+
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        future.add_done_callback(self._report_failure)
+
+    def _report_failure(self, future: Future[None]) -> None:
+        if future.cancelled() or future.exception() is None:
+            return
+        exc = future.exception()
+        LOG.error("Ports task failed", exc_info=exc)
+        dpg.set_value(self._status_tag, f"Error: {exc}")
 
     def _on_scan_clicked(self, sender: int | str, app_data: None, user_data: None) -> None:
         port = dpg.get_value(self._port_input_tag)
-        self.scan_port(int(port))
+        self._schedule(self.scan_port(int(port)))
 
     def _on_clear_clicked(self, sender: int | str, app_data: None, user_data: None) -> None:
         self.clear_results()
@@ -65,9 +94,12 @@ class PortsController:
         dpg.set_value(self._status_tag, "Netstat report copied to clipboard")
 
     def _on_suggest_clicked(self, sender: int | str, app_data: None, user_data: None) -> None:
-        suggestion = self.suggest_free_port(range_start=3000, range_end=3100)
+        self._schedule(self._suggest_port(range_start=3000, range_end=3100))
+
+    async def _suggest_port(self, range_start: int, range_end: int) -> None:
+        suggestion = await self.suggest_free_port(range_start=range_start, range_end=range_end)
         if suggestion is None:
-            dpg.set_value(self._status_tag, "No free port found in range 3000-3100")
+            dpg.set_value(self._status_tag, f"No free port found in range {range_start}-{range_end}")
         else:
             dpg.set_value(self._port_input_tag, suggestion)
             dpg.set_value(self._status_tag, f"Suggested free port: {suggestion}")
@@ -77,8 +109,8 @@ class PortsController:
         dpg.set_value(self._status_tag, "")
         self._bindings_cache = []
 
-    def scan_port(self, port: int) -> None:
-        bindings = list_bindings(port)
+    async def scan_port(self, port: int) -> None:
+        bindings = await asyncio.to_thread(list_bindings, port)
         self._bindings_cache = bindings
         conflicts = self._detect_conflicts(bindings)
         self._populate_table(bindings, conflicts)
@@ -91,35 +123,59 @@ class PortsController:
         else:
             dpg.set_value(self._status_tag, f"No listeners detected on port {port}")
 
-    def _populate_table(self, bindings: Iterable[PortBinding], conflicts: set[int]) -> None:
-        self._clear_table()
-        for binding in bindings:
-            scope = "Loopback" if binding.is_loopback else ("All Interfaces" if binding.is_unspecified else "Specific IP")
-            with dpg.table_row(parent=self._table_tag):
-                pid_text = dpg.add_text(str(binding.pid))
-                if binding.pid in conflicts:
-                    dpg.bind_item_theme(pid_text, self._conflict_theme)
-                dpg.add_text(binding.process_name)
-                dpg.add_text(binding.address)
-                dpg.add_text(binding.state)
-                scope_cell = dpg.add_text(scope)
-                if binding.pid in conflicts:
-                    dpg.bind_item_theme(scope_cell, self._conflict_theme)
-                dpg.add_button(label="Kill", callback=self._on_kill_clicked, user_data=binding.pid, enabled=binding.pid > 0)
+    def _populate_table(self, bindings: Sequence[PortBinding], conflicts: set[int]) -> None:
+        """Fill pooled rows with ``bindings`` and hide the unused ones.
+
+        Rows come pre-allocated from the tab builder (the pool grows if a scan
+        returns more bindings); a slot's cells are rewritten only when its
+        binding or conflict state changed.
+        """
+
+        while len(self._rows) < len(bindings):
+            row = add_ports_row(len(self._rows))
+            dpg.set_item_callback(row.kill, self._on_kill_clicked)
+            self._rows.append(row)
+            self._rendered.append(None)
+
+        for index, binding in enumerate(bindings):
+            row = self._rows[index]
+            rendered = (binding, binding.pid in conflicts)
+            if self._rendered[index] != rendered:
+                self._render_row(row, *rendered)
+                self._rendered[index] = rendered
+            if index >= self._visible_rows:
+                dpg.configure_item(row.row, show=True)
+
+        for row in self._rows[len(bindings):self._visible_rows]:
+            dpg.configure_item(row.row, show=False)
+        self._visible_rows = len(bindings)
+
+    def _render_row(self, row: PortsRowTags, binding: PortBinding, conflict: bool) -> None:
+        dpg.set_value(row.pid, str(binding.pid))
+        dpg.set_value(row.process, binding.process_name)
+        dpg.set_value(row.address, binding.address)
+        dpg.set_value(row.state, binding.state)
+        dpg.set_value(row.scope, self._describe_scope(binding))
+        theme = self._conflict_theme if conflict else 0
+        dpg.bind_item_theme(row.pid, theme)
+        dpg.bind_item_theme(row.scope, theme)
+        dpg.configure_item(row.kill, user_data=binding.pid, enabled=binding.pid > 0)
 
     def _clear_table(self) -> None:
-        children = dpg.get_item_children(self._table_tag, 1) or []
-        for child in children:
-            dpg.delete_item(child)
+        for row in self._rows[:self._visible_rows]:
+            dpg.configure_item(row.row, show=False)
+        self._visible_rows = 0
 
     @property
     def _conflict_theme(self) -> int:
-        if not hasattr(self, "__conflict_theme"):
-            with dpg.theme() as theme:
-                with dpg.theme_component(dpg.mvAll):
-                    dpg.add_theme_color(dpg.mvThemeCol_Text, (255, 99, 71, 255), category=dpg.mvThemeCat_Core)
-            self.__conflict_theme = theme
-        return self.__conflict_theme
+        if self._conflict_theme_id is None:
+            theme = dpg.add_theme()
+            component = dpg.add_theme_component(dpg.mvAll, parent=theme)
+            dpg.add_theme_color(
+                dpg.mvThemeCol_Text, (255, 99, 71, 255), category=dpg.mvThemeCat_Core, parent=component
+            )
+            self._conflict_theme_id = theme
+        return self._conflict_theme_id
 
     @staticmethod
     def _detect_conflicts(bindings: Iterable[PortBinding]) -> set[int]:
@@ -131,19 +187,19 @@ class PortsController:
         pid = int(user_data)
         if pid <= 0:
             return
+        self._schedule(self._kill_process(pid))
+
+    async def _kill_process(self, pid: int) -> None:
         try:
-            proc = psutil.Process(pid)
-            proc.terminate()
-            try:
-                proc.wait(timeout=5)
-            except psutil.TimeoutExpired:
-                proc.kill()
+            await asyncio.to_thread(_terminate_process, pid)
         except psutil.Error as exc:
             dpg.set_value(self._status_tag, f"Failed to terminate PID {pid}: {exc}")
         else:
+            clear_connections_cache()
+            process_snapshot.invalidate()
             dpg.set_value(self._status_tag, f"Terminated PID {pid}; rescanning...")
             port = dpg.get_value(self._port_input_tag)
-            self.scan_port(int(port))
+            await self.scan_port(int(port))
 
     @staticmethod
     def _describe_scope(binding: PortBinding) -> str:
@@ -153,18 +209,24 @@ class PortsController:
             return "All Interfaces"
         return "Specific IP"
 
-    def suggest_free_port(self, range_start: int, range_end: int) -> int | None:
-        occupied = {b.address.split(":")[-1] for b in self._bindings_cache if b.address}
+    async def suggest_free_port(self, range_start: int, range_end: int) -> int | None:
+        used = await asyncio.to_thread(used_ports)
         for port in range(range_start, range_end + 1):
-            if str(port) not in occupied:
-                try:
-                    psutil.net_connections(kind="tcp")
-                except psutil.Error:
-                    pass
-                if not list_bindings(port):
-                    return port
+            if port not in used:
+                return port
         return None
 
 
+def _terminate_process(pid: int) -> None:
+    """Terminate ``pid``, escalating to kill if it ignores the request for 5 s."""
+
+    proc = psutil.Process(pid)
+    proc.terminate()
+    try:
+        proc.wait(timeout=5)
+    except psutil.TimeoutExpired:
+        proc.kill()
+
+
 __all__ = ["PortsController"]
 
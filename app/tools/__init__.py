@@ -1,8 +1,8 @@
 """Tool registry for the Windows Sanity Suite."""
 
-from .hosts import HOSTS_PATH, read_hosts, write_hosts
+from .hosts import HOSTS_PATH, iter_hosts, read_hosts, write_hosts
 from .network import NetworkTool
-from .ports import PortBinding, list_bindings
+from .ports import PortBinding, PortsTool, clear_connections_cache, list_bindings, used_ports
 from .processes import ProcessHandleInfo, get_top_processes_by_handles
 from .services import ServicesTool
 
@@ -10,10 +10,14 @@ __all__ = [
     "HOSTS_PATH",
     "NetworkTool",
     "PortBinding",
+    "PortsTool",
     "ProcessHandleInfo",
     "ServicesTool",
+    "clear_connections_cache",
     "get_top_processes_by_handles",
+    "iter_hosts",
     "list_bindings",
     "read_hosts",
+    "used_ports",
     "write_hosts",
 ]
@@ -3,9 +3,9 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Dict, List
+from typing import Dict, Tuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
 
 from app.core.exec import CommandSpec
 
@@ -24,7 +24,10 @@ class Action(BaseModel):
     description: str
     parameters: type[ActionParameters] | None = None
     requires_admin: bool = False
-    exec_steps: List[CommandSpec] = Field(default_factory=list)
+    # A tuple, so actions shared between tool instances cannot be mutated.
+    exec_steps: Tuple[CommandSpec, ...] = ()
+
+    model_config = {"frozen": True}
 
 
 class Tool(ABC):
@@ -3,20 +3,26 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import List
+from typing import Iterable, Iterator, List
 
 
 HOSTS_PATH = Path(r"C:\Windows\System32\drivers\etc\hosts")
+HOSTS_READ_BUFFER_SIZE = 1 << 16
 
 
 def read_hosts() -> List[str]:
-    with HOSTS_PATH.open("r", encoding="utf-8") as fh:
-        return fh.readlines()
+    return HOSTS_PATH.read_text(encoding="utf-8").splitlines(keepends=True)
 
 
-def write_hosts(lines: List[str]) -> None:
-    with HOSTS_PATH.open("w", encoding="utf-8") as fh:
-        fh.writelines(lines)
+def iter_hosts() -> Iterator[str]:
+    """Yield hosts file lines lazily for callers that only need to scan."""
 
+    with HOSTS_PATH.open("r", encoding="utf-8", buffering=HOSTS_READ_BUFFER_SIZE) as fh:
+        yield from fh
 
-__all__ = ["read_hosts", "write_hosts", "HOSTS_PATH"]
+
+def write_hosts(lines: Iterable[str]) -> None:
+    HOSTS_PATH.write_text("".join(lines), encoding="utf-8")
+
+
+__all__ = ["iter_hosts", "read_hosts", "write_hosts", "HOSTS_PATH"]
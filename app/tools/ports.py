@@ -2,15 +2,26 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from ipaddress import ip_address
-from typing import List
+import time
+from typing import Any, Dict, FrozenSet, List, NamedTuple, Tuple
 
 import psutil
 
+from app.core.exec import CommandSpec
+from app.tools.base import Action, Tool
 
-@dataclass(slots=True)
-class PortBinding:
+from .process_snapshot import get_cached
+
+
+CONNECTIONS_TTL_SECONDS = 0.5
+
+_UNSPECIFIED_ADDRESSES = frozenset({"0.0.0.0", "::", ""})
+
+# kind -> (monotonic timestamp, psutil.net_connections result, local ports in use)
+_CONNECTIONS_CACHE: Dict[str, Tuple[float, List[Any], FrozenSet[int]]] = {}
+
+
+class PortBinding(NamedTuple):
     address: str
     pid: int
     state: str
@@ -20,31 +31,83 @@ class PortBinding:
     is_unspecified: bool
 
 
+def _get_snapshot(
+    kind: str = "tcp", ttl: float = CONNECTIONS_TTL_SECONDS
+) -> Tuple[float, List[Any], FrozenSet[int]]:
+    """Return the cached connection snapshot for ``kind``, refreshing it after ``ttl``."""
+
+    now = time.monotonic()
+    cached = _CONNECTIONS_CACHE.get(kind)
+    if cached is not None and now - cached[0] < ttl:
+        return cached
+
+    conns = psutil.net_connections(kind=kind)
+    ports = frozenset(laddr[1] for conn in conns if (laddr := conn.laddr))
+    snapshot = _CONNECTIONS_CACHE[kind] = (now, conns, ports)
+    return snapshot
+
+
+def used_ports(kind: str = "tcp", ttl: float = CONNECTIONS_TTL_SECONDS) -> FrozenSet[int]:
+    """Return the local ports with at least one ``kind`` socket bound to them."""
+
+    return _get_snapshot(kind, ttl)[2]
+
+
+def clear_connections_cache() -> None:
+    """Drop cached connection snapshots, e.g. after killing a process."""
+
+    _CONNECTIONS_CACHE.clear()
+
+
 def list_bindings(port: int) -> List[PortBinding]:
-    """Return all TCP bindings for the given port."""
+    """Return all TCP bindings for the given port.
 
-    bindings: List[PortBinding] = []
-    for conn in psutil.net_connections(kind="tcp"):
-        if not conn.laddr:
-            continue
-        if conn.laddr.port != port:
-            continue
+    Connection snapshots are shared for ``CONNECTIONS_TTL_SECONDS`` so quick
+    successive scans do not each enumerate every socket. Ports with nothing
+    bound to them are answered from the snapshot's port set without a scan.
+    """
 
-        pid = conn.pid or 0
+    # One snapshot lookup, so the port set and the sockets always agree.
+    _, conns, used = _get_snapshot("tcp")
+    if port not in used:
+        return []
+
+    # Reject non-matching sockets before any other attribute access; laddr is
+    # an (ip, port) namedtuple, and positional indexing skips the name lookup.
+    matches = [
+        conn
+        for conn in conns
+        if (laddr := conn.laddr) and laddr[1] == port
+    ]
+    if not matches:
+        return []
+
+    # Reuse a fresh process snapshot if one exists, but never enumerate every
+    # process just to label a few PIDs; otherwise look each PID up once.
+    processes = get_cached() or {}
+    name_map: Dict[int, str] = {}
+    for pid in {conn.pid for conn in matches if conn.pid}:
+        info = processes.get(pid)
+        if info is not None and info.name:
+            name_map[pid] = info.name
+            continue
         try:
-            process_name = psutil.Process(pid).name() if pid else "<unknown>"
+            proc = psutil.Process(pid)
+            with proc.oneshot():
+                name_map[pid] = proc.name()
         except psutil.Error:
-            process_name = "<unknown>"
+            name_map[pid] = "<unknown>"
+
+    bindings: List[PortBinding] = []
+    for conn in matches:
+        pid = conn.pid or 0
+        process_name = name_map.get(pid, "<unknown>")
 
         ip = conn.laddr.ip
         address = f"{ip}:{conn.laddr.port}"
-        try:
-            ip_obj = ip_address(ip)
-            is_loopback = ip_obj.is_loopback
-            is_unspecified = ip_obj.is_unspecified
-        except ValueError:
-            is_loopback = ip.startswith("127.") or ip in {"::1"}
-            is_unspecified = ip in {"0.0.0.0", "::"}
+        # psutil reports canonical literals, so string checks suffice here.
+        is_loopback = ip == "::1" or ip.startswith("127.")
+        is_unspecified = ip in _UNSPECIFIED_ADDRESSES
 
         bindings.append(
             PortBinding(
@@ -61,4 +124,46 @@ def list_bindings(port: int) -> List[PortBinding]:
     return bindings
 
 
-__all__ = ["PortBinding", "list_bindings"]
+# Built once at import; every tool instance shares these frozen actions.
+_ACTIONS: Dict[str, Action] = {
+    action.id: action
+    for action in (
+        Action(
+            id="scan_port",
+            label="Scan Port",
+            description="netstat -ano | findstr :<port>",
+            exec_steps=(
+                CommandSpec(
+                    executor="cmd",
+                    command="netstat -ano | findstr :$env:TARGET_PORT",
+                    timeout=20,
+                    env={"TARGET_PORT": "3010"},
+                ),
+            ),
+        ),
+        Action(
+            id="kill_pid",
+            label="Kill Process",
+            description="taskkill /PID <pid> /F",
+            exec_steps=(
+                CommandSpec(
+                    executor="cmd",
+                    command="taskkill /PID $env:TARGET_PID /F",
+                    timeout=15,
+                    env={"TARGET_PID": "0"},
+                ),
+            ),
+        ),
+    )
+}
+
+
+class PortsTool(Tool):
+    name = "ports"
+    description = "Inspect and free TCP ports"
+
+    def register_actions(self) -> None:
+        self.actions = dict(_ACTIONS)
+
+
+__all__ = ["PortBinding", "PortsTool", "clear_connections_cache", "list_bindings", "used_ports"]
@@ -0,0 +1,73 @@
+"""Shared, short-lived snapshot of running processes."""
+
+from __future__ import annotations
+
+import platform
+import time
+from typing import Dict, NamedTuple, Tuple
+
+import psutil
+
+
+SNAPSHOT_TTL_SECONDS = 0.5
+
+IS_WINDOWS = platform.system() == "Windows"
+
+# num_handles() only exists on Windows; asking for it elsewhere is an error.
+_ATTRS = ("name", "exe", "num_handles") if IS_WINDOWS else ("name", "exe")
+
+# (monotonic timestamp, pid -> info), or None when there is no snapshot
+_SNAPSHOT: Tuple[float, Dict[int, "ProcInfo"]] | None = None
+
+
+class ProcInfo(NamedTuple):
+    name: str | None
+    exe: str | None
+    num_handles: int | None
+
+
+def get_snapshot(ttl: float = SNAPSHOT_TTL_SECONDS) -> Dict[int, ProcInfo]:
+    """Return ``pid -> ProcInfo`` for every process, reusing a snapshot younger than ``ttl``.
+
+    Processes are enumerated once with ``process_iter``, which reads each
+    process's attributes under a single ``oneshot()``. Attributes we may not
+    read are ``None``.
+    """
+
+    global _SNAPSHOT
+
+    cached = get_cached(ttl)
+    if cached is not None:
+        return cached
+
+    now = time.monotonic()
+    processes: Dict[int, ProcInfo] = {}
+    for proc in psutil.process_iter(_ATTRS, ad_value=None):
+        info = proc.info
+        processes[proc.pid] = ProcInfo(
+            name=info["name"],
+            exe=info["exe"],
+            num_handles=info.get("num_handles"),
+        )
+
+    _SNAPSHOT = (now, processes)
+    return processes
+
+
+def get_cached(ttl: float = SNAPSHOT_TTL_SECONDS) -> Dict[int, ProcInfo] | None:
+    """Return the current snapshot if it is younger than ``ttl``, without enumerating."""
+
+    snapshot = _SNAPSHOT
+    if snapshot is not None and time.monotonic() - snapshot[0] < ttl:
+        return snapshot[1]
+    return None
+
+
+def invalidate() -> None:
+    """Drop the current snapshot, e.g. after terminating a process."""
+
+    global _SNAPSHOT
+    _SNAPSHOT = None
+
+
+__all__ = ["IS_WINDOWS", "ProcInfo", "SNAPSHOT_TTL_SECONDS", "get_cached", "get_snapshot", "invalidate"]
@@ -2,15 +2,14 @@
 
 from __future__ import annotations
 
-import platform
-from dataclasses import dataclass
-from typing import List
+import heapq
+from operator import attrgetter
+from typing import List, NamedTuple
 
-import psutil
+from .process_snapshot import IS_WINDOWS, get_snapshot
 
 
-@dataclass(slots=True)
-class ProcessHandleInfo:
+class ProcessHandleInfo(NamedTuple):
     process_name: str
     pid: int
     handle_count: int
@@ -18,47 +17,30 @@ class ProcessHandleInfo:
 
 
 def get_top_processes_by_handles(limit: int = 25) -> List[ProcessHandleInfo]:
-    """Return the top processes by handle count (Windows only)."""
+    """Return the top processes by handle count (Windows only).
 
-    if platform.system() != "Windows":
+    Handle counts come from the shared process snapshot, so a refresh that
+    also scans ports enumerates processes only once.
+    """
+
+    if not IS_WINDOWS:
         # num_handles() is Windows-specific
         return []
 
-    processes: List[ProcessHandleInfo] = []
-
-    for proc in psutil.process_iter(attrs=["pid", "name"]):
-        try:
-            pid = proc.pid
-            process_name = proc.name()
-
-            # Get handle count (Windows-specific)
-            handle_count = proc.num_handles()
-
-            # Try to get the process executable path
-            try:
-                path = proc.exe()
-            except (psutil.AccessDenied, psutil.NoSuchProcess):
-                path = "<access denied>"
-
-            processes.append(
-                ProcessHandleInfo(
-                    process_name=process_name,
-                    pid=pid,
-                    handle_count=handle_count,
-                    path=path,
-                )
-            )
-
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
-            # Process may have terminated or we don't have access
-            continue
-        except AttributeError:
-            # num_handles() might not be available on this platform
-            continue
-
-    # Sort by handle count descending and return top N
-    processes.sort(key=lambda p: p.handle_count, reverse=True)
-    return processes[:limit]
+    processes = (
+        ProcessHandleInfo(
+            process_name=info.name,
+            pid=pid,
+            handle_count=info.num_handles,
+            path=info.exe or "<access denied>",
+        )
+        for pid, info in get_snapshot().items()
+        # Skip processes we don't have access to
+        if info.name is not None and info.num_handles is not None
+    )
+
+    # Select the top N by handle count without sorting the full list.
+    return heapq.nlargest(limit, processes, key=attrgetter("handle_count"))
 
 
 __all__ = ["ProcessHandleInfo", "get_top_processes_by_handles"]
@@ -2,57 +2,66 @@
 
 from __future__ import annotations
 
+from typing import Dict
+
 from app.core.exec import CommandSpec
 from app.tools.base import Action, Tool
 
 
-class ServicesTool(Tool):
-    name = "services"
-    description = "Manage Windows services"
-
-    def register_actions(self) -> None:
-        self.actions["list"] = Action(
+# Built once at import; every tool instance shares these frozen actions.
+_ACTIONS: Dict[str, Action] = {
+    action.id: action
+    for action in (
+        Action(
             id="list",
             label="List Services",
             description="Get-Service",
-            exec_steps=[
+            exec_steps=(
                 CommandSpec(
                     executor="powershell",
                     command="Get-Service | ConvertTo-Json",
                     timeout=15,
-                )
-            ],
-        )
-
-        self.actions["start"] = Action(
+                ),
+            ),
+        ),
+        Action(
             id="start",
             label="Start Service",
             description="Start-Service",
-            exec_steps=[
+            exec_steps=(
                 CommandSpec(
                     executor="powershell",
                     command="Start-Service -Name $env:TARGET_SERVICE",
                     env={"TARGET_SERVICE": ""},
                     elevate=True,
-                )
-            ],
+                ),
+            ),
             requires_admin=True,
-        )
-
-        self.actions["stop"] = Action(
+        ),
+        Action(
             id="stop",
             label="Stop Service",
             description="Stop-Service",
-            exec_steps=[
+            exec_steps=(
                 CommandSpec(
                     executor="powershell",
                     command="Stop-Service -Name $env:TARGET_SERVICE",
                     env={"TARGET_SERVICE": ""},
                     elevate=True,
-                )
-            ],
+                ),
+            ),
             requires_admin=True,
-        )
+        ),
+    )
+}
+
+
+class ServicesTool(Tool):
+    name = "services"
+    description = "Manage Windows services"
+
+    def register_actions(self) -> None:
+        self.actions = dict(_ACTIONS)
 
 
 __all__ = ["ServicesTool"]
@@ -28,6 +28,7 @@ class NavigationController:
         self._tabs: List[TabDefinition] = list(tabs)
         self._content_tags: Dict[str, str] = {}
         self._nav_tags: Dict[str, str] = {}
+        self._pending_builders: Dict[str, TabBuilder] = {}
         self._active_tab: str | None = None
 
         if not self._tabs:
@@ -51,6 +52,12 @@ class NavigationController:
                 )
 
     def _build_content(self) -> None:
+        """Create an empty, hidden container per tab.
+
+        Builders run lazily on the tab's first :meth:`show_tab`, so unvisited
+        tabs cost nothing at startup.
+        """
+
         for tab in self._tabs:
             content_tag = f"sanity_content_{tab.id}"
             self._content_tags[tab.id] = content_tag
@@ -63,7 +70,7 @@ class NavigationController:
                 autosize_y=True,
                 no_scrollbar=False,
             )
-            tab.builder(content_tag)
+            self._pending_builders[tab.id] = tab.builder
 
     def show_tab(self, tab_id: str) -> None:
         if tab_id == self._active_tab:
@@ -72,10 +79,16 @@ class NavigationController:
         if tab_id not in self._content_tags:
             raise KeyError(f"Unknown tab: {tab_id}")
 
-        for key, content_tag in self._content_tags.items():
-            dpg.configure_item(content_tag, show=key == tab_id)
-            nav_tag = self._nav_tags[key]
-            dpg.set_value(nav_tag, key == tab_id)
+        builder = self._pending_builders.pop(tab_id, None)
+        if builder is not None:
+            builder(self._content_tags[tab_id])
+
+        # Only the outgoing and incoming tabs change state.
+        if self._active_tab is not None:
+            dpg.configure_item(self._content_tags[self._active_tab], show=False)
+            dpg.set_value(self._nav_tags[self._active_tab], False)
+        dpg.configure_item(self._content_tags[tab_id], show=True)
+        dpg.set_value(self._nav_tags[tab_id], True)
 
         self._active_tab = tab_id
 
@@ -2,11 +2,60 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+
 from dearpygui import dearpygui as dpg
 
 from app.tools import PortBinding
 
 
+PORTS_ROW_POOL_SIZE = 64
+
+
+@dataclass(frozen=True, slots=True)
+class PortsRowTags:
+    row: str
+    pid: str
+    process: str
+    address: str
+    state: str
+    scope: str
+    kill: str
+
+
+def ports_row_tags(index: int) -> PortsRowTags:
+    """Return the widget tags of pooled ports-table row ``index``."""
+
+    prefix = f"ports_row_{index}"
+    return PortsRowTags(
+        row=prefix,
+        pid=f"{prefix}_pid",
+        process=f"{prefix}_process",
+        address=f"{prefix}_address",
+        state=f"{prefix}_state",
+        scope=f"{prefix}_scope",
+        kill=f"{prefix}_kill",
+    )
+
+
+def add_ports_row(index: int) -> PortsRowTags:
+    """Append a hidden, empty row to the ports table for the controller to fill.
+
+    Every widget gets an explicit parent so this is safe to call off the main
+    thread, where DPG's shared container stack may belong to another builder.
+    """
+
+    tags = ports_row_tags(index)
+    dpg.add_table_row(parent="ports_table", tag=tags.row, show=False)
+    dpg.add_text("", tag=tags.pid, parent=tags.row)
+    dpg.add_text("", tag=tags.process, parent=tags.row)
+    dpg.add_text("", tag=tags.address, parent=tags.row)
+    dpg.add_text("", tag=tags.state, parent=tags.row)
+    dpg.add_text("", tag=tags.scope, parent=tags.row)
+    dpg.add_button(label="Kill", tag=tags.kill, enabled=False, parent=tags.row)
+    return tags
+
+
 def build_dashboard_tab(parent: str) -> None:
     with dpg.group(parent=parent):
         dpg.add_text("Dashboard controls coming soon")
@@ -39,6 +88,11 @@ def build_ports_tab(parent: str) -> None:
             dpg.add_table_column(label="Scope")
             dpg.add_table_column(label="Actions")
 
+        # Rows are pooled and toggled by PortsController instead of being
+        # created and deleted on every scan.
+        for index in range(PORTS_ROW_POOL_SIZE):
+            add_ports_row(index)
+
         dpg.add_text("", tag="ports_status_text")
 
 
@@ -124,6 +178,10 @@ def build_settings_tab(parent: str) -> None:
 
 
 __all__ = [
+    "PORTS_ROW_POOL_SIZE",
+    "PortsRowTags",
+    "add_ports_row",
+    "ports_row_tags",
     "build_dashboard_tab",
     "build_ports_tab",
     "build_network_tab",
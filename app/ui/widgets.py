@@ -7,18 +7,21 @@ from typing import Iterable
 from dearpygui import dearpygui as dpg
 
 
+_TOAST_COLORS = {
+    "info": (0, 122, 204, 255),
+    "success": (76, 175, 80, 255),
+    "warning": (255, 193, 7, 255),
+    "error": (244, 67, 54, 255),
+}
+
+
 def add_toast(message: str, *, severity: str = "info") -> None:
     """Show a toast notification with the given severity."""
 
-    colors = {
-        "info": (0, 122, 204, 255),
-        "success": (76, 175, 80, 255),
-        "warning": (255, 193, 7, 255),
-        "error": (244, 67, 54, 255),
-    }
-    fg_color = colors.get(severity, colors["info"])
+    fg_color = _TOAST_COLORS.get(severity, _TOAST_COLORS["info"])
 
-    with dpg.window(label="Notification", no_title_bar=True, modal=False, tag="toast"):
+    # Each toast gets its own tag; a fixed tag collides with any toast still open.
+    with dpg.window(label="Notification", no_title_bar=True, modal=False, tag=dpg.generate_uuid()):
         dpg.add_text(message, color=fg_color)
 
 
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
+import os
 from dataclasses import dataclass
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List, Sequence
 from pathlib import Path
 
 from app.core.config import load_workflow, workflows_dir
@@ -16,6 +18,7 @@ class WorkflowStep:
     action_ref: str
     params: Dict[str, Any]
     on_fail: str = "stop"
+    parallel: bool = False
 
 
 class WorkflowEngine:
@@ -31,19 +34,43 @@ class WorkflowEngine:
             tool.register_actions()
 
     async def execute(self, steps: List[WorkflowStep], *, is_admin: bool) -> List[CommandResult]:
+        """Run workflow steps in order, overlapping those marked independent.
+
+        Steps run one at a time unless they opt in with ``parallel = true``;
+        each contiguous run of such steps (with ``on_fail != "stop"``)
+        executes concurrently. If a step raises, its siblings are cancelled
+        and the exception propagates. A ``stop`` step ends the workflow if
+        any of its commands fail. Results keep step order.
+        """
+
         results: List[CommandResult] = []
-        for step in steps:
-            tool_name, action_id = step.action_ref.split(".")
-            tool = self.tools[tool_name]
-            action = tool.get_action(action_id)
-
-            specs = action.exec_steps
-            step_results = await self.runner.run_sequence_async(specs, is_admin=is_admin)
-            results.extend(step_results)
-            if any(not r.succeeded for r in step_results) and step.on_fail == "stop":
+        for group in _group_steps(steps):
+            try:
+                # A TaskGroup cancels the other steps as soon as one raises.
+                async with asyncio.TaskGroup() as task_group:
+                    tasks = [
+                        task_group.create_task(
+                            self.runner.run_sequence_async(self._resolve_specs(step), is_admin=is_admin)
+                        )
+                        for step in group
+                    ]
+            except ExceptionGroup as exc:
+                # Surface the failure the way a sequential step would.
+                raise exc.exceptions[0]
+
+            group_results = [task.result() for task in tasks]
+            for step_results in group_results:
+                results.extend(step_results)
+
+            barrier = group[0]
+            if barrier.on_fail == "stop" and any(not r.succeeded for r in group_results[0]):
                 break
         return results
 
+    def _resolve_specs(self, step: WorkflowStep) -> Sequence[CommandSpec]:
+        tool_name, action_id = step.action_ref.split(".")
+        return self.tools[tool_name].get_action(action_id).exec_steps
+
     def load_from_file(self, path: Path) -> List[WorkflowStep]:
         data = load_workflow(path)
         steps: List[WorkflowStep] = []
@@ -53,18 +80,48 @@ class WorkflowEngine:
                     action_ref=raw["action_ref"],
                     params=raw.get("params", {}),
                     on_fail=raw.get("on_fail", "stop"),
+                    parallel=bool(raw.get("parallel", False)),
                 )
             )
         return steps
 
     def list_samples(self) -> Dict[str, Path]:
         samples: Dict[str, Path] = {}
-        for path in workflows_dir().glob("*.toml"):
-            samples[path.stem] = path
-        for path in workflows_dir().glob("*.json"):
-            samples[path.stem] = path
+        # One directory pass; a JSON workflow wins over a TOML one of the same name.
+        try:
+            entries = os.scandir(workflows_dir())
+        except FileNotFoundError:
+            return samples
+        with entries:
+            for entry in entries:
+                stem, ext = os.path.splitext(entry.name)
+                ext = ext.lower()
+                if ext not in (".toml", ".json") or not entry.is_file():
+                    continue
+                if ext == ".json":
+                    samples[stem] = Path(entry.path)
+                else:
+                    samples.setdefault(stem, Path(entry.path))
         return samples
 
 
+def _group_steps(steps: Iterable[WorkflowStep]) -> List[List[WorkflowStep]]:
+    """Split steps into runs of parallel, non-stopping steps; other steps stand alone."""
+
+    groups: List[List[WorkflowStep]] = []
+    current: List[WorkflowStep] = []
+    for step in steps:
+        if step.parallel and step.on_fail != "stop":
+            current.append(step)
+        else:
+            if current:
+                groups.append(current)
+                current = []
+            groups.append([step])
+    if current:
+        groups.append(current)
+    return groups
+
+
 __all__ = ["WorkflowEngine", "WorkflowStep"]
 